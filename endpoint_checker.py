@@ -5,27 +5,55 @@ Checks URLs for availability with comprehensive error handling, retry logic, and
 """
 
 import argparse
+import asyncio
+import atexit
+import errno
 import json
 import logging
+import mmap
 import os
+import queue
+import random
+import re
+import socket
+import ssl
+import stat
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from threading import Lock
-from urllib.parse import urlparse
+from enum import IntEnum
+from functools import lru_cache, partial
+from itertools import chain, islice, zip_longest
+from logging.handlers import QueueHandler, QueueListener
+from urllib.parse import urljoin, urlsplit
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from ipaddress import ip_address, ip_network, AddressValueError
+from typing import (Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple,
+                    TypedDict, Union)
+from ipaddress import ip_address, ip_network, AddressValueError, IPv4Network, IPv6Network
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import aiohttp
 import validators
 from dotenv import load_dotenv
 from colorama import init, Fore, Style
 from tqdm import tqdm
 
+try:
+    import orjson  # Optional: faster JSON serialization
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import uvloop  # Optional: faster event loop (not available on Windows)
+except ImportError:
+    uvloop = None  # type: ignore[assignment]
+
+try:
+    import resource  # Optional: open file limits (not available on Windows)
+except ImportError:
+    resource = None  # type: ignore[assignment]
+
 # Initialize colorama for cross-platform colored output
 init(autoreset=True)
 
@@ -43,8 +71,215 @@ BLOCKED_NETWORKS = [
     ip_network('fc00::/7'),  # IPv6 private
 ]
 
+# Blocked networks grouped by IP version, so addresses skip the other family
+BLOCKED_NETWORKS_BY_VERSION: Dict[int, List[Union[IPv4Network, IPv6Network]]] = {
+    4: [network for network in BLOCKED_NETWORKS if network.version == 4],
+    6: [network for network in BLOCKED_NETWORKS if network.version == 6],
+}
+
 MAX_URL_LENGTH = 2048
 MAX_REDIRECTS = 10
+DNS_CACHE_TTL = 600  # seconds
+KEEPALIVE_TIMEOUT = 15  # seconds an idle pooled connection is kept for reuse
+MAX_RESOLVER_THREADS = 64
+MAX_DRAIN_BYTES = 64 * 1024  # Largest body read just to keep a connection alive
+MAX_RETRY_DELAY = 8.0  # seconds
+# Each request can hold up to three sockets (see create_config_from_args),
+# so this needs a raised open file limit
+MAX_CONCURRENCY = 1000
+FD_RESERVE = 64  # File descriptors left for output files, logs and the resolver
+MAX_IDLE_CONNECTIONS = 1000  # Across all hosts, if the open file limit leaves room
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+HEAD_FALLBACK_STATUSES = (405, 501)  # Method Not Allowed, Not Implemented
+FIRST_BYTE_HEADERS = {'Range': 'bytes=0-0'}
+CLOSE_HEADERS = {'Connection': 'close'}
+
+# Necessary (not sufficient) shape of a valid URL, checked before validators.url
+URL_SHAPE_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$', re.IGNORECASE)
+
+# Non-blank, non-comment line of the input file, with surrounding whitespace stripped
+URL_LINE_RE = re.compile(rb'^[ \t\f\v]*([^\s#][^\r\n]*?)[ \t\r\f\v]*$', re.MULTILINE)
+
+# Error classification by exception class; looked up along the exception's MRO,
+# so the most specific class wins (DNS and SSL errors are connection errors too)
+ERROR_CLASSES = {
+    asyncio.TimeoutError: 'TIMEOUT',
+    aiohttp.ServerTimeoutError: 'TIMEOUT',
+    aiohttp.ClientConnectorDNSError: 'DNS_ERROR',
+    aiohttp.ClientSSLError: 'SSL_ERROR',
+    aiohttp.ClientConnectionError: 'CONNECTION_ERROR',
+}
+
+# Connect errors that say the remote host is unreachable, as opposed to local
+# resource exhaustion (EMFILE, ENFILE, EADDRNOTAVAIL) that says nothing about it
+DEAD_HOST_ERRNOS = frozenset({
+    errno.ECONNREFUSED, errno.EHOSTUNREACH, errno.ENETUNREACH, errno.ETIMEDOUT,
+})
+
+# Fallback error classification by message, for exceptions not recognised by type
+ERROR_PATTERNS = [
+    ('DNS_ERROR', re.compile(
+        r'could not resolve host|name or service not known|nodename nor servname|'
+        r'temporary failure in name resolution|getaddrinfo failed|failed to resolve')),
+    ('CONNECTION_ERROR', re.compile(
+        r'connection refused|connection timed out|no route to host|network is unreachable|'
+        r'connection reset|connection aborted')),
+    ('SSL_ERROR', re.compile(r'ssl|tls|certificate|handshake')),
+]
+
+
+@lru_cache(maxsize=8192)
+def _host_is_blocked(host: str) -> bool:
+    """Check whether a hostname is a private/local IP address, cached per host."""
+    try:
+        ip = ip_address(host)
+    except (ValueError, AddressValueError, TypeError):
+        # Not an IP address, continue with domain validation
+        return False
+    return any(ip in network for network in BLOCKED_NETWORKS_BY_VERSION[ip.version])
+
+
+def _server_keeps_alive(response: aiohttp.ClientResponse) -> bool:
+    """Check whether the server left a response's connection open for reuse (RFC 9112, 9.3)."""
+    options = {option.strip().lower()
+               for value in response.headers.getall('Connection', ())
+               for option in value.split(',')}
+    if 'close' in options:
+        return False
+    version = response.version
+    return (version is not None and version >= aiohttp.HttpVersion11) or 'keep-alive' in options
+
+
+class StatCode(IntEnum):
+    """Index of each result category in URLChecker.counters."""
+    ACTIVE = 0
+    INACTIVE = 1
+    TIMEOUT = 2
+    DNS_ERROR = 3
+    CONNECTION_ERROR = 4
+    SSL_ERROR = 5
+    OTHER_ERROR = 6
+
+
+# Summary stats keys, in StatCode order
+STAT_KEYS = ['active', 'inactive', 'timeouts', 'dns_errors',
+             'connection_errors', 'ssl_errors', 'other_errors']
+
+# Number of URLs reordered round-robin by host at a time
+HOST_ORDER_WINDOW = 10000
+
+# Progress bar refresh throttle
+PROGRESS_INTERVAL = 0.2  # seconds
+
+# Progress bar description, colored only when the bar is drawn on a terminal
+PROGRESS_TEMPLATE = "Active: {} | Inactive: {} | Errors: {}: "
+PROGRESS_TEMPLATE_COLOR = (f"{Fore.GREEN}Active: {{}}{Style.RESET_ALL} | Inactive: {{}} | "
+                           f"{Fore.RED}Errors: {{}}{Style.RESET_ALL}: ")
+
+# Output batching
+WRITE_BATCH_SIZE = 256
+WRITE_BATCH_INTERVAL = 0.5  # seconds
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that only flushes on warnings and errors.
+
+    Routine records (one per URL with --verbose) are left in the file
+    buffer and written out in blocks instead of one write per record.
+    """
+    
+    def emit(self, record):
+        self._flush_record = record.levelno >= logging.WARNING
+        super().emit(record)
+        
+    def flush(self):
+        if getattr(self, '_flush_record', True):
+            super().flush()
+
+
+class IdleConnections:
+    """Count of the connections idling in aiohttp's pool, per host and in total.
+
+    The connector's limit only covers connections in use, while each idle one
+    keeps a file descriptor open until it's reused or expires. Connections are
+    counted once they're actually pooled, and uncounted when taken again (seen
+    through connection trace hooks) or when the keep-alive timeout has closed them.
+    """
+    
+    def __init__(self, limit: int, keepalive_timeout: float):
+        self.limit = limit
+        self.total = 0
+        self._hosts: Dict[tuple, List[float]] = {}  # (host, port) -> [count, when last pooled]
+        # aiohttp's cleanup runs once per keep-alive period, so an idle
+        # connection is closed within two of them
+        self._lifetime = 2 * keepalive_timeout
+        self._last_sweep = 0.0
+        
+    def count(self, key) -> int:
+        """Return the number of idle connections to a host."""
+        entry = self._hosts.get(key)
+        return int(entry[0]) if entry else 0
+        
+    def has_room(self) -> bool:
+        """Check whether another idle connection fits under the limit."""
+        if self.total >= self.limit:
+            self._expire()
+        return self.total < self.limit
+        
+    def add(self, key):
+        """Count a connection that went back to the pool."""
+        entry = self._hosts.setdefault(key, [0, 0.0])
+        entry[0] += 1
+        entry[1] = time.monotonic()
+        self.total += 1
+        
+    def take(self, key, count: int = 1):
+        """Stop counting idle connections to a host that were reused or are gone."""
+        entry = self._hosts.get(key)
+        if entry is None:
+            return
+        count = min(count, self.count(key))
+        self.total -= count
+        entry[0] -= count
+        if not entry[0]:
+            del self._hosts[key]
+            
+    def clear(self, key):
+        """Stop counting all idle connections to a host."""
+        self.take(key, self.count(key))
+        
+    def _expire(self):
+        """Forget connections the connector has closed by now, at most once a second."""
+        now = time.monotonic()
+        if now - self._last_sweep < 1.0:
+            return
+        self._last_sweep = now
+        
+        deadline = now - self._lifetime
+        for key in [key for key, (_, last) in self._hosts.items() if last < deadline]:
+            self.clear(key)
+
+
+class ParsedURL(NamedTuple):
+    """A validated, normalized URL with the parts needed to route it, parsed once."""
+    url: str
+    host: str
+    port: int
+
+
+class CheckResult(TypedDict, total=False):
+    """Outcome of checking one URL, as written to the output files."""
+    url: str
+    final_url: str  # Successful responses only
+    status: str
+    http_code: str
+    response_time: str
+    size: str  # Successful responses only
+    error_type: Optional[str]
+    error_message: Optional[str]
+    attempt: int
+    timestamp: str
+    redirects: int  # Successful responses only
 
 
 class URLChecker:
@@ -52,157 +287,230 @@ class URLChecker:
     
     def __init__(self, config):
         self.config = config
-        self.stats = {
-            'total': 0,
-            'active': 0,
-            'inactive': 0,
-            'timeouts': 0,
-            'dns_errors': 0,
-            'connection_errors': 0,
-            'ssl_errors': 0,
-            'other_errors': 0,
-            'start_time': None,
-            'processed': 0
-        }
-        self.file_lock = Lock()
+        self.processed = 0
+        self.start_time = None
+        self.counters = [0] * len(StatCode)
+        
+        # Output paths are fixed for the run
+        self._path_active = f"{config.output_file}_active.txt"
+        self._path_inactive = f"{config.output_file}_inactive.txt"
+        self._path_log = f"log/{Path(config.output_file).name}.log"  # Sanitized
+        self.stats = {}  # Built from the counters by print_summary()
+        self._ts_cache = (0, '')
         self.setup_logging()
-        self.session = self._create_session()
+        self.session = None  # Created inside the event loop by run()
+        self._request = None  # session.request with the per-run options bound
+        # The method is fixed for the run; redirects are followed with HEAD or GET
+        self._redirect_method = 'HEAD' if config.method == 'HEAD' else 'GET'
+        self._report_size = config.method == 'GET'
+        self.write_queue = None
+        self._retry_tasks = set()  # Pending deferred retries, kept referenced until done
+        self._dead_hosts = {}  # (host, port) -> final result of a URL that couldn't connect
+        # Idle pooled sockets hold a file descriptor each, so a connection is only
+        # kept when another pending URL for its host can reuse it, and while the
+        # open file limit leaves room for it
+        self._host_pending = defaultdict(int)  # (host, port) -> URLs ordered but not finished
+        self._idle = IdleConnections(config.idle_limit, KEEPALIVE_TIMEOUT)
+        self._fmain = None
+        self._factive = None
+        self._finactive = None
         self.progress_bar = None
+        self._progress_template = PROGRESS_TEMPLATE
+        self._pending_progress = 0
+        self._last_progress = 0.0
         
-    def _create_session(self) -> requests.Session:
-        """Create a requests session with security features and connection pooling."""
-        session = requests.Session()
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create an aiohttp session with security features and connection pooling."""
+        # One verifying SSL context for every connection, so the CA store is loaded once
+        ssl_context = ssl.create_default_context()
         
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=0,  # We handle retries manually
-            backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "POST"]
+        # Configure connector with connection pooling and DNS caching
+        connector = aiohttp.TCPConnector(
+            limit=self.config.threads,
+            limit_per_host=self.config.per_host,  # 0 means no per-host limit
+            keepalive_timeout=KEEPALIVE_TIMEOUT,  # Keep idle connections around for same-host reuse
+            ttl_dns_cache=DNS_CACHE_TTL,
+            use_dns_cache=True,
+            ssl=ssl_context  # Always verify SSL certificates for security
         )
         
-        # Configure adapter with connection pooling
-        adapter = HTTPAdapter(
-            max_retries=retry_strategy,
-            pool_connections=min(self.config.threads * 2, 100),
-            pool_maxsize=min(self.config.threads * 2, 100),
-            pool_block=False
+        # Time spent waiting for a free pooled connection (e.g. behind the
+        # per-host limit) must not count, so only socket operations are timed
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=self.config.connect_timeout,
+            sock_read=self.config.timeout
         )
         
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
         # Set default headers
-        session.headers.update({
+        headers = {
             'User-Agent': self.config.user_agent,
             'Accept': '*/*',
             'Accept-Encoding': 'gzip, deflate',
             'Connection': 'keep-alive',
-        })
+        }
         
         # Add custom headers
         for header in self.config.headers:
             if ':' in header:
                 key, value = header.split(':', 1)
-                session.headers[key.strip()] = value.strip()
+                headers[key.strip()] = value.strip()
         
         # Configure authentication
+        auth = None
         if self.config.auth:
             username, password = self.config.auth.split(':', 1)
-            session.auth = (username, password)
+            auth = aiohttp.BasicAuth(username, password)
         
-        # Security: Don't follow redirects automatically (we'll handle it)
-        # Note: Setting max_redirects doesn't affect allow_redirects=False in requests
+        # Track which hosts' pooled connections get reused, to bound idle sockets
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_reuseconn.append(self._on_connection_reused)
+        trace_config.on_connection_create_start.append(self._on_connection_create)
         
-        # Always verify SSL certificates for security
-        session.verify = True
+        # Security: Redirects are never followed automatically (we'll handle it)
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers=headers,
+            auth=auth,
+            trace_configs=[trace_config]
+        )
+        
+    async def _on_connection_reused(self, session, context, params):
+        """Account for a pooled connection being taken for a request."""
+        self._idle.take(context.trace_request_ctx)
+            
+    async def _on_connection_create(self, session, context, params):
+        """Account for a new connection, which means the host had none left idle."""
+        self._idle.clear(context.trace_request_ctx)
         
-        return session
-    
     def setup_logging(self):
         """Configure logging based on verbosity level."""
         log_level = logging.DEBUG if self.config.verbose else logging.INFO
         if self.config.quiet:
             log_level = logging.WARNING
             
-        # Sanitize output file path
-        safe_output_file = Path(self.config.output_file).name
+        handlers = [BufferedFileHandler(self._path_log)]
+        if not self.config.quiet:
+            handlers.append(logging.StreamHandler(sys.stdout))
+            
+        # Records are formatted by the queue handler and written out by a
+        # listener thread, keeping log I/O off the event loop
+        log_queue = queue.Queue()
+        self.log_listener = QueueListener(log_queue, *handlers)
+        self.log_listener.start()
+        atexit.register(self.log_listener.stop)
         
         logging.basicConfig(
             level=log_level,
             format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(f"log/{safe_output_file}.log"),
-                logging.StreamHandler(sys.stdout) if not self.config.quiet else logging.NullHandler()
-            ]
+            handlers=[QueueHandler(log_queue)]
         )
         self.logger = logging.getLogger(__name__)
         
-    def load_urls(self):
-        """Load URLs from input file with validation."""
+    def iter_urls(self) -> Iterator[ParsedURL]:
+        """Yield validated, de-duplicated URLs from the input file in a single regex pass."""
         if not os.path.exists(self.config.input_file):
             self.logger.error(f"Input file '{self.config.input_file}' not found")
             sys.exit(1)
             
-        urls = []
+        # Only the normalized URLs seen so far are kept, for skipping duplicates
+        seen = set()
+        loaded = duplicates = 0
         try:
-            with open(self.config.input_file, 'r') as file:
-                for line_num, line in enumerate(file, 1):
-                    url = line.strip()
-                    if url and not url.startswith('#'):
-                        if self.validate_url(url):
-                            urls.append(url)
-                        else:
-                            self.logger.warning(f"Invalid URL on line {line_num}: {url}")
+            with open(self.config.input_file, 'rb') as file:
+                for raw, line_num in self._read_url_lines(file):
+                    try:
+                        url = raw.decode()
+                    except UnicodeDecodeError:
+                        self.logger.warning(f"Invalid URL on line {line_num()}: {raw!r}")
+                        continue
+                        
+                    # Skip duplicates before paying for validation, including lines
+                    # that only differ by a missing scheme
+                    normalized = self.normalize_url(url)
+                    if normalized in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(normalized)
+                    
+                    parsed = self.parse_url(url)
+                    if parsed is not None:
+                        loaded += 1
+                        yield parsed
+                    else:
+                        self.logger.warning(f"Invalid URL on line {line_num()}: {url}")
         except Exception as e:
             self.logger.error(f"Error reading input file: {e}")
             sys.exit(1)
             
-        if not urls:
-            self.logger.error("No valid URLs found in input file")
-            sys.exit(1)
-            
-        self.logger.info(f"Loaded {len(urls)} URLs to test")
-        return urls
+        if duplicates:
+            self.logger.info(f"Skipped {duplicates} duplicate lines")
+        self.logger.info(f"Loaded {loaded} URLs to test")
         
-    def validate_url(self, url: str) -> bool:
-        """Validate URL format with security checks."""
+    def _read_url_lines(self, file) -> Iterator[Tuple[bytes, Callable[[], int]]]:
+        """Yield each non-blank, non-comment input line with a function returning its line number."""
+        info = os.fstat(file.fileno())
+        if not stat.S_ISREG(info.st_mode):
+            # Pipes (e.g. <(cat urls.txt) or /dev/stdin) can't be mapped; read them line by line
+            for line_num, line in enumerate(file, 1):
+                match = URL_LINE_RE.match(line)
+                if match:
+                    yield match.group(1), partial(int, line_num)
+            return
+            
+        # mmap can't map an empty file
+        if info.st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # Line numbers are only needed for warnings, so count them lazily
+            counted = [1, 0]  # Line number at the position counted up to
+            
+            def line_at(pos: int) -> int:
+                counted[0] += data[counted[1]:pos].count(b'\n')
+                counted[1] = pos
+                return counted[0]
+                
+            for match in URL_LINE_RE.finditer(data):
+                yield match.group(1), partial(line_at, match.start())
+                
+    def parse_url(self, url: str) -> Optional[ParsedURL]:
+        """Validate and normalize a URL with security checks, returning None if invalid."""
         try:
             # Add http:// if no scheme provided
-            if not url.startswith(('http://', 'https://')):
-                url = f"http://{url}"
+            url = self.normalize_url(url)
             
             # Check URL length
             if len(url) > MAX_URL_LENGTH:
                 self.logger.warning(f"URL too long: {url[:50]}...")
-                return False
+                return None
+            
+            # Cheap shape check first, so malformed lines skip the full validator
+            if not URL_SHAPE_RE.match(url):
+                return None
             
             # Use validators library for proper validation
             if not validators.url(url):
-                return False
+                return None
             
             # Parse and check for private IPs
-            parsed = urlparse(url)
+            parsed = urlsplit(url)
+            if parsed.hostname is None:
+                return None
             
-            # Check if hostname is an IP address
-            try:
-                ip = ip_address(parsed.hostname)
-                # Block private/local IP addresses
-                for network in BLOCKED_NETWORKS:
-                    if ip in network:
-                        self.logger.warning(f"Blocked private IP: {url}")
-                        return False
-            except (ValueError, AddressValueError, TypeError):
-                # Not an IP address, continue with domain validation
-                pass
+            # Block private/local IP addresses
+            if _host_is_blocked(parsed.hostname):
+                self.logger.warning(f"Blocked private IP: {url}")
+                return None
             
-            return True
+            port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+            return ParsedURL(url, parsed.hostname, port)
             
         except Exception as e:
-            self.logger.debug(f"URL validation error: {e}")
-            return False
+            self.logger.debug("URL validation error: %s", e)
+            return None
             
-    def normalize_url(self, url):
+    def normalize_url(self, url: str) -> str:
         """Normalize URL by adding http:// if no scheme provided."""
         if not url.startswith(('http://', 'https://')):
             return f"http://{url}"
@@ -210,93 +518,123 @@ class URLChecker:
         
     def classify_error(self, exception: Exception) -> str:
         """Classify errors based on exception type."""
+        for cls in type(exception).__mro__:
+            error_type = ERROR_CLASSES.get(cls)
+            if error_type is not None:
+                return error_type
+                
+        # Unrecognised exception type: fall back to the error message
         error_str = str(exception).lower()
-        exception_type = type(exception).__name__
-        
-        # DNS resolution errors
-        if 'nodename nor servname provided' in error_str or \
-           'name or service not known' in error_str or \
-           'getaddrinfo failed' in error_str or \
-           'Failed to resolve' in error_str:
-            return 'DNS_ERROR'
-            
-        # Connection errors
-        elif 'connection refused' in error_str or \
-             'connection reset' in error_str or \
-             'connection aborted' in error_str or \
-             isinstance(exception, requests.exceptions.ConnectionError):
-            return 'CONNECTION_ERROR'
-            
-        # SSL/TLS errors
-        elif 'ssl' in error_str or \
-             'certificate' in error_str or \
-             isinstance(exception, requests.exceptions.SSLError):
-            return 'SSL_ERROR'
-            
-        # Timeout errors
-        elif isinstance(exception, requests.exceptions.Timeout) or \
-             'timeout' in error_str:
-            return 'TIMEOUT'
-            
-        # Other errors
-        else:
-            return 'OTHER_ERROR'
+        for error_type, pattern in ERROR_PATTERNS:
+            if pattern.search(error_str):
+                return error_type
+        return 'OTHER_ERROR'
             
-    def test_url_with_retry(self, url):
-        """Test URL with retry logic and exponential backoff."""
-        normalized_url = self.normalize_url(url)
-        
-        for attempt in range(self.config.max_retries + 1):
-            try:
-                result = self.test_url_single(normalized_url, attempt + 1)
-                
-                # Don't retry on DNS errors or successful responses
-                if result['error_type'] == 'DNS_ERROR' or result['status'] == 'ACTIVE':
-                    return result
-                    
-                # Retry on network errors
-                if attempt < self.config.max_retries:
-                    delay = (2 ** attempt) * 0.5  # Exponential backoff: 0.5s, 1s, 2s
-                    self.logger.debug(f"Retrying {url} in {delay}s (attempt {attempt + 2})")
-                    time.sleep(delay)
-                else:
-                    return result
-                    
-            except Exception as e:
-                if attempt < self.config.max_retries:
-                    delay = (2 ** attempt) * 0.5
-                    time.sleep(delay)
-                else:
-                    return {
-                        'url': url,
-                        'status': 'ERROR',
-                        'http_code': 'N/A',
-                        'response_time': 'N/A',
-                        'error_type': 'OTHER_ERROR',
-                        'error_message': str(e),
-                        'timestamp': datetime.now().isoformat()
-                    }
-                    
-    def test_url_single(self, url: str, attempt_num: int) -> Dict[str, Any]:
-        """Test a single URL using requests library with security features."""
-        start_time = time.time()
+    def retry_delay(self, attempt: int) -> float:
+        """Exponential backoff (0.5s, 1s, 2s, ... capped) with random jitter."""
+        delay = min(MAX_RETRY_DELAY, (2 ** attempt) * 0.5)
+        # Jitter keeps retries against the same host from firing in lockstep
+        return delay * (0.5 + random.random())
         
+    async def test_url_attempt(self, parsed: ParsedURL, attempt: int) -> CheckResult:
+        """Run a single attempt (0-based) at checking a URL."""
         try:
-            # Prepare request parameters
-            request_params = {
-                'timeout': (self.config.connect_timeout, self.config.timeout),
-                'allow_redirects': False,  # Handle redirects manually for security
-                'stream': True,  # Don't download entire body for HEAD requests
-                'verify': True,  # Always verify SSL certificates
+            return await self.test_url_single(parsed, attempt + 1)
+        except Exception as e:
+            return {
+                'url': parsed.url,
+                'status': 'ERROR',
+                'http_code': 'N/A',
+                'response_time': 'N/A',
+                'error_type': 'OTHER_ERROR',
+                'error_message': str(e),
+                'timestamp': self._timestamp()
             }
             
-            # Make the request based on method
-            if self.config.method == 'HEAD':
-                response = self.session.head(url, **request_params)
-            elif self.config.method == 'POST':
-                response = self.session.post(url, **request_params)
-            else:  # GET
-                response = self.session.get(url, **request_params)
+    def dead_host_result(self, parsed: ParsedURL) -> Optional[CheckResult]:
+        """Return a failed result for a URL whose host already couldn't be reached."""
+        failure = self._dead_hosts.get((parsed.host, parsed.port))
+        if failure is None:
+            return None
+        return {
+            **failure,
+            'url': parsed.url,
+            'response_time': 'N/A',
+            'error_message': f"Skipped, host unreachable: {failure['error_message']}",
+            'timestamp': self._timestamp()
+        }
+        
+    def should_retry(self, result: CheckResult, attempt: int) -> bool:
+        """Decide whether a failed attempt should be retried."""
+        # Don't retry on DNS errors or successful responses
+        if result['error_type'] == 'DNS_ERROR' or result['status'] == 'ACTIVE':
+            return False
+        return attempt < self.config.max_retries
+        
+    def _keep_alive(self, key, origin) -> bool:
+        """Check whether a connection to this host is worth keeping for a later URL."""
+        # Every pooled socket holds a file descriptor until it's reused or expires,
+        # so keep one only while another pending URL on the host can reuse it.
+        # This request takes one of the host's idle connections itself, if any
+        others_pending = self._host_pending.get(key, 0) - (key == origin)
+        if others_pending <= max(self._idle.count(key) - 1, 0):
+            return False
+            
+        # Like a pool manager's pool limit, cap idle connections across all hosts
+        return self._idle.has_room()
+        
+    async def _finish_response(self, response: aiohttp.ClientResponse, key, keep_alive: bool):
+        """Release a response, draining small bodies so a kept connection can be reused."""
+        # Unread bodies force the connection closed anyway, so only drain small ones
+        length = response.content_length
+        drainable = response.method == 'HEAD' or (length is not None and length <= MAX_DRAIN_BYTES)
+        if not (keep_alive and drainable):
+            response.close()
+            return
+            
+        # sock_read only bounds each read, so a trickled body needs an overall limit
+        try:
+            await asyncio.wait_for(response.read(), self.config.timeout)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # The status is what counts; a broken, undecodable (e.g. bad gzip)
+            # or too slow body only means the connection can't be reused
+            response.close()
+            return
+        response.release()
+        
+        # aiohttp only pools the connection if the server didn't close it
+        if _server_keeps_alive(response):
+            self._idle.add(key)
+        
+    async def _send(self, method: str, parsed: ParsedURL, origin) -> aiohttp.ClientResponse:
+        """Send one request without following redirects, retrying unsupported HEADs as GET."""
+        key = (parsed.host, parsed.port)
+        
+        # Bodiless responses (e.g. to HEAD) go back to the pool as soon as they
+        # arrive, so whether to keep the connection is decided up front
+        keep_alive = self._keep_alive(key, origin)
+        headers = None if keep_alive else CLOSE_HEADERS
+        response = await self._request(method, parsed.url, headers=headers, trace_request_ctx=key)
+        
+        # Some servers don't implement HEAD; ask for just the first byte instead
+        if method == 'HEAD' and response.status in HEAD_FALLBACK_STATUSES:
+            await self._finish_response(response, key, keep_alive)
+            headers = FIRST_BYTE_HEADERS if keep_alive else {**FIRST_BYTE_HEADERS, **CLOSE_HEADERS}
+            response = await self._request('GET', parsed.url, headers=headers, trace_request_ctx=key)
+            
+        await self._finish_response(response, key, keep_alive)
+        return response
+        
+    async def test_url_single(self, parsed: ParsedURL, attempt_num: int) -> CheckResult:
+        """Test a single URL using aiohttp with security features."""
+        url = parsed.url
+        origin = (parsed.host, parsed.port)
+        target = parsed  # The URL currently requested, which a connect error is about
+        start_time = time.time()
+        
+        try:
+            # Handle redirects manually for security
+            response = await self._send(self.config.method, parsed, origin)
             
             # Calculate response time
             response_time = time.time() - start_time
@@ -305,36 +643,36 @@ class URLChecker:
             redirect_count = 0
             final_url = url
             
-            while response.is_redirect and redirect_count < MAX_REDIRECTS:
+            while (response.status in REDIRECT_STATUSES and
+                   redirect_count < MAX_REDIRECTS):
                 redirect_url = response.headers.get('Location')
                 if not redirect_url:
                     break
                     
                 # Make redirect URL absolute
-                redirect_url = requests.compat.urljoin(url, redirect_url)
+                redirect_url = urljoin(final_url, redirect_url)
                 
                 # Validate redirect URL for security
-                if not self.validate_url(redirect_url):
+                redirect = self.parse_url(redirect_url)
+                if redirect is None:
                     self.logger.warning(f"Blocked redirect to invalid URL: {redirect_url}")
                     break
+                target = redirect
                 
                 # Follow redirect
-                if self.config.method == 'HEAD':
-                    response = self.session.head(redirect_url, **request_params)
-                else:
-                    response = self.session.get(redirect_url, **request_params)
+                response = await self._send(self._redirect_method, target, origin)
                 
                 final_url = redirect_url
                 redirect_count += 1
             
             # Get response size (for GET requests)
             size = '0'
-            if self.config.method == 'GET' and response.headers.get('content-length'):
-                size = response.headers.get('content-length', '0')
+            if self._report_size and response.headers.get('Content-Length'):
+                size = response.headers.get('Content-Length', '0')
             
             # Determine status
-            http_code = str(response.status_code)
-            if response.status_code < 400:
+            http_code = str(response.status)
+            if response.status < 400:
                 status = 'ACTIVE'
             else:
                 status = 'INACTIVE'
@@ -349,11 +687,11 @@ class URLChecker:
                 'error_type': None,
                 'error_message': None,
                 'attempt': attempt_num,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': self._timestamp(),
                 'redirects': redirect_count
             }
             
-        except requests.exceptions.Timeout:
+        except asyncio.TimeoutError:
             return {
                 'url': url,
                 'status': 'TIMEOUT',
@@ -362,12 +700,12 @@ class URLChecker:
                 'error_type': 'TIMEOUT',
                 'error_message': 'Request timed out',
                 'attempt': attempt_num,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._timestamp()
             }
             
         except Exception as e:
             error_type = self.classify_error(e)
-            return {
+            result: CheckResult = {
                 'url': url,
                 'status': 'ERROR',
                 'http_code': 'N/A',
@@ -375,75 +713,115 @@ class URLChecker:
                 'error_type': error_type,
                 'error_message': str(e),
                 'attempt': attempt_num,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._timestamp()
             }
             
-    def update_stats(self, result):
+            # Every attempt to reach this host failed; skip its remaining URLs.
+            # A temporary DNS failure (EAI_AGAIN) may just be a resolver under load.
+            # Keyed by the URL's own host: e.host is IDNA-encoded (xn--...)
+            if (isinstance(e, aiohttp.ClientConnectorError) and
+                    ((error_type == 'DNS_ERROR' and e.os_error.errno != socket.EAI_AGAIN) or
+                     (error_type == 'CONNECTION_ERROR' and e.os_error.errno in DEAD_HOST_ERRNOS)) and
+                    not self.should_retry(result, attempt_num - 1)):
+                self._dead_hosts[target.host, target.port] = result
+            return result
+            
+    def _timestamp(self) -> str:
+        """Return the current time as an ISO string, cached to one-second resolution."""
+        second = int(time.time())
+        if second != self._ts_cache[0]:
+            self._ts_cache = (second, datetime.fromtimestamp(second).isoformat())
+        return self._ts_cache[1]
+        
+    def update_stats(self, result: CheckResult):
         """Update statistics based on result."""
-        self.stats['processed'] += 1
-        
-        if result['status'] == 'ACTIVE':
-            self.stats['active'] += 1
-        elif result['status'] == 'INACTIVE':
-            self.stats['inactive'] += 1
-        elif result['error_type'] == 'TIMEOUT':
-            self.stats['timeouts'] += 1
-        elif result['error_type'] == 'DNS_ERROR':
-            self.stats['dns_errors'] += 1
-        elif result['error_type'] == 'CONNECTION_ERROR':
-            self.stats['connection_errors'] += 1
-        elif result['error_type'] == 'SSL_ERROR':
-            self.stats['ssl_errors'] += 1
-        else:
-            self.stats['other_errors'] += 1
-            
-    def write_result(self, result):
-        """Write result to appropriate output files."""
-        with self.file_lock:
-            # Write to main output file
-            if self.config.output_format == 'json':
-                with open(self.config.output_file, 'a') as f:
-                    f.write(json.dumps(result) + '\n')
+        self.processed += 1
+        
+        # Errors are counted by type, successful responses by status
+        key = result['error_type'] or result['status']
+        self.counters[StatCode.__members__.get(key, StatCode.OTHER_ERROR)] += 1
+            
+    def write_result(self, result: CheckResult):
+        """Queue result for the writer task, which formats and writes it."""
+        self.write_queue.put_nowait(result)
+        
+    def format_result(self, result: CheckResult) -> str:
+        """Format a result as a line of the main output file."""
+        if self.config.output_format == 'json':
+            if orjson is not None:
+                return orjson.dumps(result).decode() + '\n'
+            return json.dumps(result, separators=(',', ':')) + '\n'
+            
+        # Build the line in one pass instead of growing it with +=
+        http_code = result['http_code']
+        response_time = result['response_time']
+        error_message = result['error_message']
+        return ''.join((
+            result['url'], ': ', result['status'],
+            f" (HTTP {http_code})" if http_code != 'N/A' else '',
+            f" [{response_time}]" if response_time != 'N/A' else '',
+            f" - {error_message}" if error_message else '',
+            '\n'
+        ))
+        
+    def _write_batch(self, batch: List[CheckResult]):
+        """Format a batch of queued results and write them to the output files."""
+        self._fmain.writelines([self.format_result(result) for result in batch])
+        self._fmain.flush()
+        
+        # Write to separate files for active/inactive URLs
+        active = [f"{r['url']}\n" for r in batch if r['status'] == 'ACTIVE']
+        inactive = [f"{r['url']}\n" for r in batch if r['status'] in ['INACTIVE', 'ERROR', 'TIMEOUT']]
+        for url_file, url_lines in ((self._factive, active), (self._finactive, inactive)):
+            if url_lines:
+                url_file.writelines(url_lines)
+                url_file.flush()
+                
+    async def _writer(self):
+        """Drain the write queue in batches, formatting and writing them off the event loop."""
+        batch = []
+        last_write = time.monotonic()
+        
+        while True:
+            # Once a batch is pending, wait for more only until its interval is up
+            timeout = max(last_write + WRITE_BATCH_INTERVAL - time.monotonic(), 0) if batch else None
+            try:
+                item = await asyncio.wait_for(self.write_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                pass
             else:
-                with open(self.config.output_file, 'a') as f:
-                    status_str = f"{result['url']}: {result['status']}"
-                    if result['http_code'] != 'N/A':
-                        status_str += f" (HTTP {result['http_code']})"
-                    if result['response_time'] != 'N/A':
-                        status_str += f" [{result['response_time']}]"
-                    if result['error_message']:
-                        status_str += f" - {result['error_message']}"
-                    f.write(status_str + '\n')
-                    
-            # Write to separate files for active/inactive URLs
-            if result['status'] == 'ACTIVE':
-                with open(f"{self.config.output_file}_active.txt", 'a') as f:
-                    f.write(f"{result['url']}\n")
-            elif result['status'] in ['INACTIVE', 'ERROR', 'TIMEOUT']:
-                with open(f"{self.config.output_file}_inactive.txt", 'a') as f:
-                    f.write(f"{result['url']}\n")
+                if item is None:
+                    break
+                batch.append(item)
+                if (len(batch) < WRITE_BATCH_SIZE and
+                        time.monotonic() - last_write < WRITE_BATCH_INTERVAL):
+                    continue
                     
-    def update_progress_bar(self):
-        """Update the progress bar with current stats."""
-        if self.progress_bar and not self.config.quiet:
-            # Update progress bar
-            self.progress_bar.update(1)
+            await asyncio.to_thread(self._write_batch, batch)
+            batch = []
+            last_write = time.monotonic()
             
-            # Update description with colored stats
-            active_color = Fore.GREEN if self.stats['active'] > 0 else Fore.WHITE
-            error_color = Fore.RED if (self.stats['timeouts'] + self.stats['dns_errors'] + 
-                                      self.stats['connection_errors'] + self.stats['ssl_errors'] + 
-                                      self.stats['other_errors']) > 0 else Fore.WHITE
+        if batch:
+            await asyncio.to_thread(self._write_batch, batch)
             
-            total_errors = (self.stats['timeouts'] + self.stats['dns_errors'] + 
-                           self.stats['connection_errors'] + self.stats['ssl_errors'] + 
-                           self.stats['other_errors'])
+    def update_progress_bar(self, completed=1, flush=False):
+        """Update the progress bar with current stats, at most every PROGRESS_INTERVAL."""
+        if self.progress_bar is not None and not self.config.quiet:
+            self._pending_progress += completed
+            now = time.monotonic()
+            if not flush and now - self._last_progress < PROGRESS_INTERVAL:
+                return
+            self._last_progress = now
             
-            desc = (f"{active_color}Active: {self.stats['active']}{Style.RESET_ALL} | "
-                   f"Inactive: {self.stats['inactive']} | "
-                   f"{error_color}Errors: {total_errors}{Style.RESET_ALL}")
-            
-            self.progress_bar.set_description(desc)
+            # Set the description without redrawing, then draw once with everything
+            # completed since the last refresh
+            self.progress_bar.set_description_str(self._progress_template.format(
+                self.counters[StatCode.ACTIVE],
+                self.counters[StatCode.INACTIVE],
+                sum(self.counters[StatCode.TIMEOUT:])
+            ), refresh=False)
+            self.progress_bar.update(self._pending_progress)
+            self._pending_progress = 0
         
     def print_summary(self):
         """Print final summary statistics."""
@@ -452,13 +830,19 @@ class URLChecker:
             print("SUMMARY")
             print("="*60)
             
+        self.stats = {
+            'processed': self.processed,
+            'start_time': self.start_time,
+            **dict(zip(STAT_KEYS, self.counters))
+        }
         elapsed = time.time() - self.stats['start_time']
-        rate = self.stats['total'] / elapsed if elapsed > 0 else 0
+        rate = self.stats['processed'] / elapsed if elapsed > 0 else 0
+        processed = max(self.stats['processed'], 1)  # Avoid division by zero
         
         summary = f"""
-Total URLs processed: {self.stats['total']}
-Active URLs: {self.stats['active']} ({self.stats['active']/self.stats['total']*100:.1f}%)
-Inactive URLs: {self.stats['inactive']} ({self.stats['inactive']/self.stats['total']*100:.1f}%)
+Total URLs processed: {self.stats['processed']}
+Active URLs: {self.stats['active']} ({self.stats['active']/processed*100:.1f}%)
+Inactive URLs: {self.stats['inactive']} ({self.stats['inactive']/processed*100:.1f}%)
 Timeouts: {self.stats['timeouts']}
 DNS Errors: {self.stats['dns_errors']}
 Connection Errors: {self.stats['connection_errors']}
@@ -470,9 +854,9 @@ Processing Rate: {rate:.1f} URLs/s
 
 Output Files:
 - Main results: {self.config.output_file}
-- Active URLs: {self.config.output_file}_active.txt
-- Inactive URLs: {self.config.output_file}_inactive.txt
-- Log file: {self.config.output_file}.log
+- Active URLs: {self._path_active}
+- Inactive URLs: {self._path_inactive}
+- Log file: {self._path_log}
         """
         
         if not self.config.quiet:
@@ -485,8 +869,8 @@ Output Files:
         """Clear previous output files."""
         files_to_clear = [
             self.config.output_file,
-            f"{self.config.output_file}_active.txt",
-            f"{self.config.output_file}_inactive.txt",
+            self._path_active,
+            self._path_inactive,
             f"{self.config.output_file}.log"
         ]
         
@@ -499,26 +883,170 @@ Output Files:
                     
     def dry_run(self, urls):
         """Perform a dry run to validate URLs without testing them."""
-        print(f"DRY RUN: Would test {len(urls)} URLs")
+        first_urls = list(islice(urls, 10))
+        total = len(first_urls) + sum(1 for _ in urls)
+        
+        print(f"DRY RUN: Would test {total} URLs")
         print(f"Configuration:")
-        print(f"  Threads: {self.config.threads}")
+        print(f"  Concurrency: {self.config.threads}")
+        print(f"  Per-host limit: {self.config.per_host or 'none'}")
         print(f"  Timeout: {self.config.timeout}s")
         print(f"  Retries: {self.config.max_retries}")
         print(f"  Method: {self.config.method}")
         print(f"  User Agent: {self.config.user_agent}")
         
         print(f"\nFirst 10 URLs to test:")
-        for i, url in enumerate(urls[:10]):
-            print(f"  {i+1}. {url}")
+        for i, parsed in enumerate(first_urls):
+            print(f"  {i+1}. {parsed.url}")
+            
+        if total > 10:
+            print(f"  ... and {total - 10} more")
+            
+    def order_by_host(self, urls: List[ParsedURL]) -> List[ParsedURL]:
+        """Order URLs round-robin across hosts.
+
+        Each host's URLs stay in sequence so its pooled keep-alive connection
+        is reused, while no single host gets all of the concurrent requests.
+        """
+        buckets = defaultdict(list)
+        for parsed in urls:
+            buckets[parsed.host, parsed.port].append(parsed)
+            
+        # The order spaces a host's URLs far apart, so they count as pending from
+        # now on rather than from when they're queued (see _keep_alive)
+        for key, bucket in buckets.items():
+            self._host_pending[key] += len(bucket)
+        return [parsed for batch in zip_longest(*buckets.values()) for parsed in batch if parsed is not None]
+        
+    def iter_by_host(self, urls: Iterable[ParsedURL]) -> Iterator[ParsedURL]:
+        """Apply order_by_host to a URL stream one window at a time, to bound memory."""
+        urls = iter(urls)
+        while True:
+            window = list(islice(urls, HOST_ORDER_WINDOW))
+            if not window:
+                return
+            yield from self.order_by_host(window)
+            
+    async def produce_urls(self, urls, url_queue):
+        """Feed URLs into the bounded queue, then one stop marker per worker."""
+        for parsed in self.iter_by_host(urls):
+            await url_queue.put((parsed, 0))
+            
+        # Deferred retries keep their URL unfinished until re-queued,
+        # so this waits for every URL to reach a final result
+        await url_queue.join()
+        for _ in range(self.config.threads):
+            await url_queue.put(None)
+            
+    async def _requeue(self, url_queue, parsed: ParsedURL, attempt: int, delay: float):
+        """Put a URL back on the queue for another attempt after a backoff delay."""
+        await asyncio.sleep(delay)
+        await url_queue.put((parsed, attempt))
+        url_queue.task_done()
+        
+    async def url_worker(self, url_queue):
+        """Check URLs from the queue until a stop marker is received."""
+        while True:
+            item = await url_queue.get()
+            if item is None:
+                return
+            parsed, attempt = item
+            
+            # Don't send requests to a host that already failed to connect
+            result = self.dead_host_result(parsed)
+            if result is None:
+                result = await self.test_url_attempt(parsed, attempt)
+                
+                if self.should_retry(result, attempt):
+                    # Back off outside the worker, so it can check other URLs meanwhile
+                    delay = self.retry_delay(attempt)
+                    self.logger.debug("Retrying %s in %.2fs (attempt %d)", parsed.url, delay, attempt + 2)
+                    task = asyncio.create_task(self._requeue(url_queue, parsed, attempt + 1, delay))
+                    self._retry_tasks.add(task)
+                    task.add_done_callback(self._retry_tasks.discard)
+                    continue
+                    
+            # The URL is finished and no longer needs a connection to its host
+            key = (parsed.host, parsed.port)
+            if self._host_pending[key] > 1:
+                self._host_pending[key] -= 1
+            else:
+                del self._host_pending[key]
+                
+            self.record_result(result)
+            url_queue.task_done()
+            
+    def record_result(self, result: CheckResult):
+        """Record the final result for a URL."""
+        self.update_stats(result)
+        self.write_result(result)
+        
+        # Update progress bar
+        self.update_progress_bar()
+            
+        # Log individual results in verbose mode
+        if self.config.verbose:
+            status_msg = f"{result['url']}: {result['status']}"
+            if result['http_code'] != 'N/A':
+                status_msg += f" (HTTP {result['http_code']})"
+            if result.get('redirects'):
+                status_msg += f" -> {result['final_url']}"
+            self.logger.debug(status_msg)
             
-        if len(urls) > 10:
-            print(f"  ... and {len(urls) - 10} more")
+    async def check_urls(self, urls):
+        """Check all URLs concurrently over a shared aiohttp session."""
+        # aiohttp resolves hostnames with getaddrinfo in the default executor;
+        # size it so lookups for different hosts don't queue behind each other
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=min(self.config.threads, MAX_RESOLVER_THREADS))
+        )
+        
+        # Keep output files open for the whole run; only the writer task touches them
+        mode = 'a' if self.config.append else 'w'
+        self._fmain = open(self.config.output_file, mode, encoding='utf-8')
+        self._factive = open(self._path_active, mode, encoding='utf-8')
+        self._finactive = open(self._path_inactive, mode, encoding='utf-8')
+        self.write_queue = asyncio.Queue()
+        writer = asyncio.create_task(self._writer())
+        
+        self.session = self._create_session()
+        self._request = partial(self.session.request, allow_redirects=False)
+        
+        # A fixed pool of workers fed through a bounded queue means URLs are read
+        # as they're needed rather than all loaded up front
+        url_queue = asyncio.Queue(maxsize=self.config.threads * 4)
+        producer = asyncio.create_task(self.produce_urls(urls, url_queue))
+        workers = [asyncio.create_task(self.url_worker(url_queue))
+                   for _ in range(self.config.threads)]
+        
+        # Results can't be recorded once the writer has failed, so stop checking
+        # right away; its error is raised when it's awaited below
+        def stop_on_writer_error(task):
+            if not task.cancelled() and task.exception() is not None:
+                for pending in (producer, *workers):
+                    pending.cancel()
+                    
+        writer.add_done_callback(stop_on_writer_error)
+        try:
+            await asyncio.gather(producer, *workers)
+        finally:
+            for task in self._retry_tasks:
+                task.cancel()
+            await self.session.close()
+            self.write_queue.put_nowait(None)
+            await writer
+            for f in (self._fmain, self._factive, self._finactive):
+                f.close()
             
     def run(self):
         """Main execution method."""
-        # Load URLs
-        urls = self.load_urls()
-        self.stats['total'] = len(urls)
+        # Stream URLs from the input file, making sure there is at least one
+        urls = self.iter_urls()
+        first_url = next(urls, None)
+        if first_url is None:
+            self.logger.error("No valid URLs found in input file")
+            sys.exit(1)
+        urls = chain([first_url], urls)
         
         # Dry run mode
         if self.config.dry_run:
@@ -529,48 +1057,52 @@ Output Files:
         if not self.config.append:
             self.clear_output_files()
             
-        self.logger.info(f"Starting URL check with {self.config.threads} threads")
-        self.stats['start_time'] = time.time()
+        self.logger.info(f"Starting URL check with {self.config.threads} concurrent requests")
+        self.start_time = time.time()
         
         # Create progress bar if not in quiet mode
         if not self.config.quiet:
+            # The total isn't known up front, so show the count and rate only
             self.progress_bar = tqdm(
-                total=len(urls),
-                desc="Processing URLs",
+                desc="Processing URLs: ",
                 unit="url",
                 ncols=100,
-                bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]'
+                bar_format='{desc}{n_fmt} [{elapsed}, {rate_fmt}]'
             )
+            # tqdm draws on stderr; skip ANSI colors when that isn't a terminal
+            if sys.stderr.isatty():
+                self._progress_template = PROGRESS_TEMPLATE_COLOR
         
-        # Process URLs with ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=self.config.threads) as executor:
-            # Submit all tasks
-            future_to_url = {executor.submit(self.test_url_with_retry, url): url for url in urls}
-            
-            # Process completed tasks
-            for future in as_completed(future_to_url):
-                result = future.result()
-                self.update_stats(result)
-                self.write_result(result)
-                
-                # Update progress bar
-                self.update_progress_bar()
-                    
-                # Log individual results in verbose mode
-                if self.config.verbose:
-                    status_msg = f"{result['url']}: {result['status']}"
-                    if result['http_code'] != 'N/A':
-                        status_msg += f" (HTTP {result['http_code']})"
-                    self.logger.debug(status_msg)
+        # Process URLs on a single event loop, using uvloop when installed
+        if uvloop is not None:
+            uvloop.run(self.check_urls(urls))
+        else:
+            asyncio.run(self.check_urls(urls))
         
         # Close progress bar
-        if self.progress_bar:
+        if self.progress_bar is not None:
+            self.update_progress_bar(completed=0, flush=True)
             self.progress_bar.close()
             
         # Final summary
         self.print_summary()
 
 
+def _raise_fd_limit(wanted: int) -> Optional[int]:
+    """Raise the soft open file limit towards the hard limit and return it, if known."""
+    if resource is None:
+        return None
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != resource.RLIM_INFINITY and soft < wanted:
+        target = wanted if hard == resource.RLIM_INFINITY else min(wanted, hard)
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+            soft = target
+        except (ValueError, OSError):
+            pass
+    return None if soft == resource.RLIM_INFINITY else soft
+
+
 def create_config_from_args():
     """Create configuration from command line arguments."""
     parser = argparse.ArgumentParser(
@@ -579,10 +1111,12 @@ def create_config_from_args():
         epilog="""
 Examples:
   %(prog)s urls.txt                          # Basic usage
-  %(prog)s urls.txt -t 20 -r 3              # 20 threads, 3 retries
+  %(prog)s urls.txt -t 20 -r 3              # 20 concurrent requests, 3 retries
   %(prog)s urls.txt -o results.json --json  # JSON output
   %(prog)s urls.txt --method HEAD --quiet   # HEAD requests, quiet mode
   %(prog)s urls.txt --dry-run               # Validate without testing
+
+Optional packages: uvloop (faster event loop), orjson (faster --json output)
         """
     )
     
@@ -598,8 +1132,8 @@ Examples:
     parser.add_argument('--connect-timeout', type=int, default=5, help='Connection timeout in seconds (default: 5)')
     parser.add_argument('-r', '--retries', dest='max_retries', type=int, default=2,
                        help='Maximum number of retries for failed requests (default: 2)')
-    parser.add_argument('-m', '--method', choices=['GET', 'HEAD', 'POST'], default='GET',
-                       help='HTTP method to use (default: GET)')
+    parser.add_argument('-m', '--method', choices=['GET', 'HEAD', 'POST'], default='HEAD',
+                       help='HTTP method to use; HEAD falls back to a one-byte GET if unsupported (default: HEAD)')
     parser.add_argument('--user-agent', default='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
                        help='User agent string')
     parser.add_argument('--auth', help='Authentication in format username:password')
@@ -607,7 +1141,9 @@ Examples:
                        help='Additional headers (can be used multiple times)')
     
     # Performance options
-    parser.add_argument('-t', '--threads', type=int, default=10, help='Number of concurrent threads (default: 10)')
+    parser.add_argument('-t', '--threads', type=int, default=10, help='Number of concurrent requests (default: 10)')
+    parser.add_argument('--per-host', type=int, default=8,
+                       help='Maximum concurrent connections per host, 0 for no limit (default: 8)')
     
     # Output options
     parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
@@ -620,8 +1156,22 @@ Examples:
     if args.quiet and args.verbose:
         parser.error("Cannot use both --quiet and --verbose")
         
-    if args.threads < 1 or args.threads > 100:
-        parser.error("Threads must be between 1 and 100")
+    if args.threads < 1 or args.threads > MAX_CONCURRENCY:
+        parser.error(f"Threads must be between 1 and {MAX_CONCURRENCY}")
+        
+    # Each request holds a socket, its previous one may still be closing, and
+    # one more can finish into the idle pool just as that fills up; idle
+    # connections get whatever the open file limit leaves
+    needed = 3 * args.threads + FD_RESERVE
+    fd_limit = _raise_fd_limit(needed + MAX_IDLE_CONNECTIONS)
+    if fd_limit is not None and needed > fd_limit:
+        max_threads = max((fd_limit - FD_RESERVE) // 3, 1)
+        parser.error(f"Threads must be at most {max_threads} with an open file limit "
+                     f"of {fd_limit} (raise it with 'ulimit -n')")
+    args.idle_limit = MAX_IDLE_CONNECTIONS if fd_limit is None else min(MAX_IDLE_CONNECTIONS, fd_limit - needed)
+        
+    if args.per_host < 0:
+        parser.error("Per-host limit cannot be negative")
         
     if args.timeout < 1 or args.timeout > 300:
         parser.error("Timeout must be between 1 and 300 seconds")
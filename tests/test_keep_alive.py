@@ -0,0 +1,133 @@
+"""Tests for the bookkeeping that decides which pooled connections are kept alive."""
+
+import argparse
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import aiohttp
+from multidict import CIMultiDict
+
+import endpoint_checker
+from endpoint_checker import IdleConnections, URLChecker, _server_keeps_alive
+
+HOST = ('example.com', 80)
+OTHER = ('example.org', 80)
+
+
+class IdleConnectionsTest(unittest.TestCase):
+
+    def test_counts_per_host_and_in_total(self):
+        idle = IdleConnections(limit=10, keepalive_timeout=15)
+        idle.add(HOST)
+        idle.add(HOST)
+        idle.add(OTHER)
+        self.assertEqual(idle.count(HOST), 2)
+        self.assertEqual(idle.count(OTHER), 1)
+        self.assertEqual(idle.total, 3)
+
+    def test_take_and_clear(self):
+        idle = IdleConnections(limit=10, keepalive_timeout=15)
+        for _ in range(3):
+            idle.add(HOST)
+        idle.add(OTHER)
+
+        idle.take(HOST)
+        self.assertEqual(idle.count(HOST), 2)
+        idle.clear(HOST)
+        self.assertEqual(idle.count(HOST), 0)
+        self.assertEqual(idle.total, 1)
+
+        # Taking more than are counted, or from an unknown host, is a no-op
+        idle.take(OTHER, 5)
+        idle.take(HOST)
+        self.assertEqual(idle.total, 0)
+
+    def test_has_room_up_to_the_limit(self):
+        idle = IdleConnections(limit=2, keepalive_timeout=15)
+        idle.add(HOST)
+        self.assertTrue(idle.has_room())
+        idle.add(OTHER)
+        self.assertFalse(idle.has_room())
+        idle.take(OTHER)
+        self.assertTrue(idle.has_room())
+
+    def test_expired_connections_make_room(self):
+        with mock.patch.object(endpoint_checker.time, 'monotonic', return_value=100.0) as clock:
+            idle = IdleConnections(limit=1, keepalive_timeout=15)
+            idle.add(HOST)
+
+            # Within two keep-alive periods the connection may still be pooled
+            clock.return_value = 129.0
+            self.assertFalse(idle.has_room())
+
+            clock.return_value = 131.0
+            self.assertTrue(idle.has_room())
+            self.assertEqual(idle.count(HOST), 0)
+            self.assertEqual(idle.total, 0)
+
+
+class ServerKeepsAliveTest(unittest.TestCase):
+
+    def response(self, version=aiohttp.HttpVersion11, **headers):
+        return SimpleNamespace(version=version, headers=CIMultiDict(headers))
+
+    def test_http11_persists_unless_closed(self):
+        self.assertTrue(_server_keeps_alive(self.response()))
+        self.assertFalse(_server_keeps_alive(self.response(Connection='close')))
+        self.assertFalse(_server_keeps_alive(self.response(Connection='Upgrade, Close')))
+
+    def test_http10_needs_keep_alive(self):
+        self.assertFalse(_server_keeps_alive(self.response(aiohttp.HttpVersion10)))
+        self.assertTrue(_server_keeps_alive(self.response(aiohttp.HttpVersion10, Connection='Keep-Alive')))
+
+
+class KeepAliveTest(unittest.TestCase):
+
+    def setUp(self):
+        # The checker writes its log under log/ relative to the working directory
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        os.makedirs('log')
+        config = argparse.Namespace(output_file='results.txt', verbose=False, quiet=True,
+                                    method='HEAD', idle_limit=4)
+        self.checker = URLChecker(config)
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def keep_alive(self, pending, idle, key=HOST, origin=HOST):
+        self.checker._host_pending[key] = pending
+        for _ in range(idle):
+            self.checker._idle.add(key)
+        return self.checker._keep_alive(key, origin)
+
+    def test_kept_while_another_url_is_pending(self):
+        self.assertTrue(self.keep_alive(pending=2, idle=0))
+
+    def test_closed_for_the_last_url_on_a_host(self):
+        self.assertFalse(self.keep_alive(pending=1, idle=0))
+
+    def test_reused_connection_counts_for_the_next_url(self):
+        # This request takes the idle connection, so the next URL needs it back
+        self.assertTrue(self.keep_alive(pending=2, idle=1))
+
+    def test_closed_when_enough_connections_are_idle(self):
+        self.assertFalse(self.keep_alive(pending=2, idle=2))
+
+    def test_redirect_to_another_host(self):
+        # The redirecting URL doesn't count as pending for the target host
+        self.assertTrue(self.keep_alive(pending=1, idle=0, key=OTHER, origin=HOST))
+
+    def test_closed_once_the_idle_limit_is_reached(self):
+        for i in range(4):
+            self.checker._idle.add((f"host{i}.example", 80))
+        self.assertFalse(self.keep_alive(pending=2, idle=0))
+
+
+if __name__ == '__main__':
+    unittest.main()